@@ -2,6 +2,7 @@
 # For details: https://github.com/tomapopov/tetris-py/blob/main/NOTICE
 
 import random
+from itertools import islice
 from typing import List, Type
 
 from . import piece
@@ -10,6 +11,21 @@ from .point import MinoPoint
 Grid = List[List[int]]
 ROW_PADDING = 2
 
+_CELL_STRS: List[str] = []
+
+
+def _cell_strs() -> List[str]:
+    """
+    Lookup table of fully-formatted cell strings, one per colour code.
+    Built lazily because piece imports board back, so the colour list may
+    not exist yet when this module is first imported.
+    :return: list of ANSI-coloured cell strings indexed by piece code
+    """
+    if not _CELL_STRS:
+        _CELL_STRS.append(piece.PIECE_COLOURS_ANSI[0].format("0"))
+        _CELL_STRS.extend(c.format("X") for c in piece.PIECE_COLOURS_ANSI[1:])
+    return _CELL_STRS
+
 
 class Board:
 
@@ -17,32 +33,65 @@ class Board:
         # grid with 2 extra rows for generating new pieces at random at the top
         self._height = height + ROW_PADDING
         self._width = width
+        # bitmask with a 1 for every column, used for O(1) full-row checks
+        self._full_mask = (1 << width) - 1
         self.reset()
 
     def reset(self) -> None:
         self._grid: Grid = self._new_rows(self._height, self._width)
+        # One int per row, bit x set when (x, y) is occupied. The grid keeps
+        # the piece colour codes for rendering; occupancy checks use the masks.
+        self._row_masks: List[int] = [0] * self._height
+        # Bumped on every mutation so renderers can skip unchanged frames
+        self._version = getattr(self, "_version", 0) + 1
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter incremented whenever the board contents change
+        :return: the current version number
+        """
+        return self._version
 
     def reached_top_row(self) -> bool:
         """
         Checks if stack has reached the top row
         :return: True if there are blocks in top row, False otherwise
         """
-        top_playable_row = self._grid[ROW_PADDING]
-        return sum(top_playable_row) > 0
+        return self._row_masks[ROW_PADDING] != 0
 
-    def clear_completed_rows(self, rows: List[int]) -> int:
+    def clear_completed_rows(self) -> int:
         """
         Checks if any rows are complete and removes them
-        :param rows: the rows to check
         :return: the number of rows cleared
         """
-        rows = sorted(rows, reverse=True)
-        removed = 0
-        for i in rows:
-            if self._full_row(i):
-                self._remove_row(i)
-                removed += 1
-        self._grid = self._new_rows(removed, self._width) + self._grid
+        full_mask = self._full_mask
+        masks = self._row_masks
+        if full_mask not in masks:
+            return 0
+        # Compact survivors downwards in place with a write pointer,
+        # skipping full rows, then zero the vacated rows at the top.
+        # The full rows' colour lists are recycled rather than reallocated.
+        grid = self._grid
+        freed = []
+        write = self._height - 1
+        for read in range(self._height - 1, -1, -1):
+            if masks[read] == full_mask:
+                freed.append(grid[read])
+                continue
+            if write != read:
+                masks[write] = masks[read]
+                grid[write] = grid[read]
+            write -= 1
+        removed = write + 1
+        width = self._width
+        for i in range(removed):
+            masks[i] = 0
+            row = freed[i]
+            for j in range(width):
+                row[j] = 0
+            grid[i] = row
+        self._version += 1
         return removed
 
     def can_add_piece(self, piece: "piece.Piece"):
@@ -51,21 +100,78 @@ class Board:
         :param piece: the piece
         :return: True if possible to add, False otherwise
         """
+        width = self._width
+        height = self._height
+        masks = self._row_masks
         for p in piece.points:
-            if self._point_outside_grid(p) or self.at_point(p) > 0:
+            if not (0 <= p.x < width and 0 <= p.y < height) or (masks[p.y] >> p.x) & 1:
+                return False
+        return True
+
+    def can_move_piece(self, piece: "piece.Piece", new_points: List[MinoPoint]) -> bool:
+        """
+        Checks if a piece can move to a new set of points, without mutating the board.
+        The piece's current cells are treated as free, since it vacates them.
+        :param piece: the piece being moved
+        :param new_points: the candidate block coordinates
+        :return: True if the piece can occupy the new points, False otherwise
+        """
+        # Fold both point lists into per-row bitmasks so the collision test
+        # is one AND per affected row rather than a lookup per block
+        old_masks = {}
+        for p in piece.points:
+            old_masks[p.y] = old_masks.get(p.y, 0) | (1 << p.x)
+        width = self._width
+        height = self._height
+        new_masks = {}
+        for p in new_points:
+            if not (0 <= p.x < width and 0 <= p.y < height):
+                return False
+            new_masks[p.y] = new_masks.get(p.y, 0) | (1 << p.x)
+        masks = self._row_masks
+        for y, m in new_masks.items():
+            if masks[y] & ~old_masks.get(y, 0) & m:
                 return False
         return True
 
+    def update_piece_location(self, piece: "piece.Piece", new_points: List[MinoPoint]) -> None:
+        """
+        Moves a piece from its current cells to a new set of cells
+        :param piece: the piece being moved
+        :param new_points: the block coordinates to move it to
+        :return: None
+        """
+        grid = self._grid
+        old_masks = {}
+        for p in piece.points:
+            grid[p.y][p.x] = 0
+            old_masks[p.y] = old_masks.get(p.y, 0) | (1 << p.x)
+        code = piece.piece_index
+        new_masks = {}
+        for p in new_points:
+            grid[p.y][p.x] = code
+            new_masks[p.y] = new_masks.get(p.y, 0) | (1 << p.x)
+        # Apply the occupancy change with one op per affected row
+        masks = self._row_masks
+        for y, m in old_masks.items():
+            masks[y] &= ~m
+        for y, m in new_masks.items():
+            masks[y] |= m
+        self._version += 1
+
     def add_piece(self, piece: "piece.Piece") -> None:
         """
         Adds a piece to the board
         :param piece: the piece to add
         :return: None
         """
+        grid = self._grid
+        masks = self._row_masks
+        code = piece.piece_index
         for p in piece.points:
-            assert self.at_point(p) == 0
-        for p in piece.points:
-            self._set_at_point(p, piece.piece_index)
+            grid[p.y][p.x] = code
+            masks[p.y] |= 1 << p.x
+        self._version += 1
 
     def space_below(self, point: MinoPoint) -> bool:
         """
@@ -75,10 +181,8 @@ class Board:
         """
         if self._point_outside_grid(point):
             return False
-        below_point = MinoPoint(point.x, point.y + 1)
-        if self._point_outside_grid(below_point):
-            return False
-        return self.at_point(below_point) == 0
+        below_y = point.y + 1
+        return below_y < self._height and not (self._row_masks[below_y] >> point.x) & 1
 
     @property
     def height(self) -> int:
@@ -107,6 +211,14 @@ class Board:
         """
         return self._grid[i + ROW_PADDING][j]
 
+    def row_occupancy(self, i: int) -> int:
+        """
+        Gets the occupancy bitmask for a row, bit j set when (i, j) is occupied
+        :param i: row
+        :return: the occupancy mask, 0 for a fully empty row
+        """
+        return self._row_masks[i + ROW_PADDING]
+
     def distance_to_stack(self, row: int, col: int):
         """
         Calculates the vertical distance from the given coordinate to the top of the stack
@@ -115,47 +227,46 @@ class Board:
         :return: vertical distance
         """
         dist = 0
+        col_bit = 1 << col
         for i in range(row + 1, self._height):
-            if self._grid[i][col] > 0:
+            if self._row_masks[i] & col_bit:
                 return dist
             dist += 1
         return dist
 
 
     def _full_row(self, idx: int) -> bool:
-        row = self._grid[idx]
-        return all(x > 0 for x in row)
-
-    def _remove_row(self, idx: int) -> None:
-        self._grid.pop(idx)
+        return self._row_masks[idx] == self._full_mask
 
     @staticmethod
     def _new_rows(height: int, width: int) -> Grid:
         return [[0] * width for _ in range(height)]
 
     def _remove_piece(self, piece: "piece.Piece") -> None:
+        grid = self._grid
+        masks = self._row_masks
         for p in piece.points:
-            assert self.at_point(p) == piece.piece_index
-        for p in piece.points:
-            self._set_at_point(p, 0)
+            grid[p.y][p.x] = 0
+            masks[p.y] &= ~(1 << p.x)
+        self._version += 1
 
     def at_point(self, p: MinoPoint) -> int:
         return self._grid[p.y][p.x]
 
     def _set_at_point(self, p: MinoPoint, val: int) -> None:
         self._grid[p.y][p.x] = val
+        if val:
+            self._row_masks[p.y] |= 1 << p.x
+        else:
+            self._row_masks[p.y] &= ~(1 << p.x)
+        self._version += 1
 
     def _point_outside_grid(self, point: MinoPoint) -> bool:
-        return (not (0 <= point.y < self._height)) or (not (0 <= point.x < self._width))
+        return not (0 <= point.x < self._width and 0 <= point.y < self._height)
 
     def __str__(self) -> str:
-        res = []
-        for row in self._grid[ROW_PADDING:]:
-            row_res = []
-            for x in row:
-                assert isinstance(x, int)
-                marker = "X" if x > 0 else "0"
-                row_res.append(piece.PIECE_COLOURS_ANSI[x].format(marker))
-            res.append(" ".join(row_res))
-        pretty_grid = "\n".join(res)
-        return str(pretty_grid)
\ No newline at end of file
+        cell_strs = _cell_strs()
+        return "\n".join(
+            " ".join(cell_strs[x] for x in row)
+            for row in islice(self._grid, ROW_PADDING, None)
+        )
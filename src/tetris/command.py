@@ -2,6 +2,8 @@
 # For details: https://github.com/tomapopov/tetris-py/blob/main/NOTICE
 
 from enum import Enum
+from typing import Optional
+
 import pygame
 
 
@@ -16,30 +18,40 @@ class Command(Enum):
     PAUSE = 8
     RESTART = 9
 
+    @classmethod
+    def parse(cls, char: str) -> Optional["Command"]:
+        """
+        Parses a command from user input, returning None if unrecognised
+        :param char: the input characters
+        :return: the command, or None if the input doesn't map to one
+        """
+        return char_mapping.get(char.upper())
+
     @classmethod
     def from_char(cls, char: str):
-        if not char.isalpha():
-            raise ValueError(f"Non-alphabet chars found in input: {char!r}")
-        char = char.upper()
-        mapping = {
-            "L": cls.MOVE_LEFT,
-            "R": cls.MOVE_RIGHT,
-            "D": cls.MOVE_DOWN,
-            "DD": cls.MOVE_BOTTOM,
-            "U": cls.ROTATE,
-            "Q": cls.QUIT,
-            "H": cls.HELP,
-            "P": cls.PAUSE,
-        }
-        if char not in mapping:
+        cmd = cls.parse(char)
+        if cmd is None:
             raise ValueError(f"Unsupported input: {char!r}")
-        return mapping[char]
+        return cmd
 
     @classmethod
     def from_pygame_key(cls, key: int):
-        if key not in pygame_key_mapping:
+        cmd = pygame_key_mapping.get(key)
+        if cmd is None:
             raise ValueError(f"Unsupported pygame key: {key}")
-        return pygame_key_mapping[key]
+        return cmd
+
+
+char_mapping = {
+    "L": Command.MOVE_LEFT,
+    "R": Command.MOVE_RIGHT,
+    "D": Command.MOVE_DOWN,
+    "DD": Command.MOVE_BOTTOM,
+    "U": Command.ROTATE,
+    "Q": Command.QUIT,
+    "H": Command.HELP,
+    "P": Command.PAUSE,
+}
 
 
 pygame_key_mapping = {
@@ -14,21 +14,31 @@ class Direction(Enum):
 
     @classmethod
     def from_command(cls, command: Command):
-        mapping = {
-            Command.MOVE_LEFT: cls.LEFT,
-            Command.MOVE_RIGHT: cls.RIGHT,
-            Command.MOVE_DOWN: cls.DOWN,
-            Command.MOVE_BOTTOM: cls.DOWN,
-        }
-        if command not in mapping:
+        direction = _COMMAND_TO_DIRECTION[command.value]
+        if direction is None:
             raise ValueError(f"Command {command} cannot be mapped to a direction")
-        return mapping[command]
+        return direction
 
     @property
     def opposite(self):
-        return {
-            Direction.DOWN: Direction.UP,
-            Direction.UP: Direction.DOWN,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }[self]
\ No newline at end of file
+        return _OPPOSITE_DIRECTION[self]
+
+
+# Built once at import so the lookups above don't rebuild a dict per call.
+# Indexed by Command.value; None marks commands with no direction.
+_COMMAND_TO_DIRECTION = tuple(
+    {
+        Command.MOVE_LEFT: Direction.LEFT,
+        Command.MOVE_RIGHT: Direction.RIGHT,
+        Command.MOVE_DOWN: Direction.DOWN,
+        Command.MOVE_BOTTOM: Direction.DOWN,
+    }.get(cmd)
+    for cmd in [None] + list(Command)
+)
+
+_OPPOSITE_DIRECTION = {
+    Direction.DOWN: Direction.UP,
+    Direction.UP: Direction.DOWN,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
\ No newline at end of file
@@ -1,8 +1,9 @@
 # Licensed under the Apache License: http://www.apache.org/licenses/LICENSE-2.0
 # For details: https://github.com/tomapopov/tetris-py/blob/main/NOTICE
 
+import time
 from abc import ABC, abstractmethod
-from typing import Type
+from typing import List, Tuple, Type
 import pygame
 
 from .board import Board
@@ -16,6 +17,35 @@ from .interface import cli as interface_cli, pygame as interface_pygame
 
 _LOOP_SLEEP_TIME_MS = 20
 
+_MOVE_COMMANDS = frozenset((Command.MOVE_LEFT, Command.MOVE_RIGHT, Command.MOVE_DOWN))
+
+
+def _fall_delays(base_ms: int, step_ms: int, floor_ms: int) -> Tuple[int, ...]:
+    """
+    Precomputes the per-level fall delay, clamped at the floor delay
+    :param base_ms: delay at level 0 in millis
+    :param step_ms: how much faster each level gets in millis
+    :param floor_ms: the fastest allowed delay in millis
+    :return: tuple of delays indexed by level, ending at the floor
+    """
+    levels = (base_ms - floor_ms) // step_ms + 1
+    return tuple(max(base_ms - lvl * step_ms, floor_ms) for lvl in range(levels + 1))
+
+
+def _coalesce_commands(cmds: List[Command]) -> List[Command]:
+    """
+    Collapses runs of identical movement commands into one, so key
+    autorepeat can't queue several collision-checked moves in a single tick
+    :param cmds: the commands read from the interface this tick
+    :return: the commands with duplicate consecutive moves removed
+    """
+    coalesced: List[Command] = []
+    for cmd in cmds:
+        if cmd in _MOVE_COMMANDS and coalesced and coalesced[-1] is cmd:
+            continue
+        coalesced.append(cmd)
+    return coalesced
+
 
 class EngineAbstract(ABC):
 
@@ -75,7 +105,7 @@ class Engine(EngineAbstract):
             for cmd in cmds:
                 if cmd in possible_cmds:
                     return cmd
-            self._wait(_LOOP_SLEEP_TIME_MS)
+            self._tick()
 
     def _run_main_loop(self) -> None:
         """
@@ -91,7 +121,7 @@ class Engine(EngineAbstract):
         run = True
         while run:
             need_to_refresh = False
-            cmds = self._interface.get_input()
+            cmds = _coalesce_commands(self._interface.get_input())
             for cmd in cmds:
                 need_to_refresh = True
                 if cmd == Command.HELP:
@@ -116,7 +146,7 @@ class Engine(EngineAbstract):
                         shifted = self._active_piece.move(direction)
                         if not shifted:
                             break
-                    lines_cleared = self._board.clear_completed_rows(list(self._active_piece.rows))
+                    lines_cleared = self._board.clear_completed_rows()
                     if lines_cleared > 0:
                         levelled_up = self._scorer.add_to_score(lines_cleared)
                         if levelled_up:
@@ -133,7 +163,7 @@ class Engine(EngineAbstract):
                     self._active_piece.move(direction)
                     if not self._active_piece.can_shift_down():
                         # Piece is now frozen in place
-                        lines_cleared = self._board.clear_completed_rows(list(self._active_piece.rows))
+                        lines_cleared = self._board.clear_completed_rows()
                         if lines_cleared > 0:
                             levelled_up = self._scorer.add_to_score(lines_cleared)
                             if levelled_up:
@@ -149,9 +179,8 @@ class Engine(EngineAbstract):
             if need_to_refresh:
                 self._interface.draw_screen()
 
-            # Pause to share CPU - not sure if/how much it's needed, haven't
-            # looked into the CPU loads yet...
-            self._wait(_LOOP_SLEEP_TIME_MS)
+            # Pause to share CPU between frames
+            self._tick()
         self._stop_downward_movement()
 
     def _new_active_piece(self) -> None:
@@ -181,6 +210,13 @@ class Engine(EngineAbstract):
         """
         ...
 
+    def _tick(self) -> None:
+        """
+        Paces the main loops, sharing CPU between frames
+        :return: None
+        """
+        self._wait(_LOOP_SLEEP_TIME_MS)
+
     @abstractmethod
     def _pause(self) -> bool:
         """
@@ -212,15 +248,31 @@ class EnginePygame(Engine):
     _FALL_DELAY = 750
     _FALL_DELAY_STEP = 50
     _MIN_FALL_DELAY = 200
+    # Delay per level, computed once; constant at the floor from the last entry on
+    _FALL_DELAYS = _fall_delays(_FALL_DELAY, _FALL_DELAY_STEP, _MIN_FALL_DELAY)
+    _FPS = 1000 // _LOOP_SLEEP_TIME_MS
+
+    def __init__(self):
+        super().__init__()
+        self._clock = pygame.time.Clock()
+
+    def _tick(self) -> None:
+        """
+        Paces the main loops to the target framerate; unlike a fixed wait,
+        Clock.tick accounts for the time spent processing the frame
+        :return: None
+        """
+        self._clock.tick(self._FPS)
 
     def _set_downward_movement(self) -> None:
         """
         Starts the automatic downward movement of pieces, so they fall as time passes
         :return: None
         """
+        delays = self._FALL_DELAYS
         pygame.time.set_timer(
             pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_DOWN}),
-            max(self._FALL_DELAY - self._scorer.level * self._FALL_DELAY_STEP, self._MIN_FALL_DELAY)
+            delays[min(self._scorer.level, len(delays) - 1)],
         )
 
 
@@ -267,11 +319,12 @@ class EngineCLI(Engine):
 
     def _wait(self, time_ms: int) -> None:
         """
-        Pauses for a given number of milliseconds
+        Pauses for a given number of milliseconds. Needed now that the CLI
+        reads input without blocking, so the loop doesn't spin at full speed
         :param time_ms: time to sleep/wait in millis
         :return: None
         """
-        pass
+        time.sleep(time_ms / 1000)
 
     def _pause(self) -> bool:
         """
@@ -1,6 +1,8 @@
 # Licensed under the Apache License: http://www.apache.org/licenses/LICENSE-2.0
 # For details: https://github.com/tomapopov/tetris-py/blob/main/NOTICE
 
+import select
+import sys
 from typing import List
 
 from ..command import Command
@@ -21,44 +23,82 @@ The possible commands are:
     7. 'H'  -> Bring up this message again
 """
 
+    _PROMPT = "Input a command [L/R/D/DD/U/Q/H]: "
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Statistics line, rebuilt only when the statistics version moves
+        self._stats_line_version = None
+        self._stats_line = ""
+        # Previous frame's lines, so redraws only rewrite what changed
+        self._prev_lines: List[str] = []
+        # Start from a clean screen so cursor-addressed redraws line up
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+
     def draw_screen(self) -> None:
         """
-        Draws the main gameplay screen
+        Draws the main gameplay screen. Rather than printing ~30 fresh lines
+        and scrolling the terminal every frame, the frame is diffed against
+        the previous one and only changed lines are rewritten in place using
+        ANSI cursor addressing, in a single buffered write.
         :return: None
         """
-        print()
-        print(f"SCORE: {self._scorer.score}")
-        print(f"LINES CLEARED: {self._scorer.lines_cleared}")
-        counts = self._statistics.shape_counts.copy()
-        total = sum(counts.values())
-        count_strs = [
-            (f"{shape.letter}: {counts[shape.letter]} "
-             f"({round(0 if total == 0 else counts[shape.letter] / total * 100, 1)}%)")
-            for shape in SHAPE_POSSIBILITIES
+        version = self._statistics.version
+        if version != self._stats_line_version:
+            counts = self._statistics.shape_counts
+            total = sum(counts.values())
+            count_strs = [
+                (f"{shape.letter}: {counts[shape.letter]} "
+                 f"({round(0 if total == 0 else counts[shape.letter] / total * 100, 1)}%)")
+                for shape in SHAPE_POSSIBILITIES
+            ]
+            self._stats_line = ", ".join(count_strs)
+            self._stats_line_version = version
+        lines = [
+            f"SCORE: {self._scorer.score}",
+            f"LINES CLEARED: {self._scorer.lines_cleared}",
+            f"STATISTICS: {self._stats_line}",
+            "Board state:",
+            *str(self._board).split("\n"),
+            "",
+            f"Next Piece: {self._piece_generator.next_piece_type.letter}",
+            self._PROMPT,
         ]
-        print(f"STATISTICS: {', '.join(count_strs)}")
-        print("Board state:")
-        print(self._board)
-        print()
-        print(f"Next Piece: {self._piece_generator.next_piece_type.letter}")
+        prev = self._prev_lines
+        out = []
+        for i, line in enumerate(lines):
+            if i < len(prev) and prev[i] == line:
+                continue
+            out.append(f"\x1b[{i + 1};1H{line}\x1b[K")
+        # Blank any leftover lines if the previous frame was taller
+        for i in range(len(lines), len(prev)):
+            out.append(f"\x1b[{i + 1};1H\x1b[K")
+        # Park the cursor after the prompt
+        out.append(f"\x1b[{len(lines)};{len(self._PROMPT) + 1}H")
+        self._prev_lines = lines
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def get_input(self) -> List[Command]:
         """
-        Returns any commands the user has inputted
+        Returns any commands the user has inputted. The read is
+        non-blocking: if no full line is waiting on stdin, the game loop
+        carries on instead of freezing until the player hits enter.
         :return: list of commands
         """
-        try:
-            cmd = Command.from_char(input("Input a command [L/R/D/DD/U/Q/H]: "))
-        except ValueError:
+        ready, _, _ = select.select([sys.stdin], [], [], 0)
+        if not ready:
             return []
-        else:
-            return [cmd]
+        cmd = Command.parse(sys.stdin.readline().strip())
+        return [] if cmd is None else [cmd]
 
     def draw_game_over(self) -> None:
         """
         Draws the end of game screen
         :return: None
         """
+        self._reset_screen()
         print("GAME OVER")
         print(f"FINAL SCORE: {self._scorer.score}")
         print(f"LINES CLEARED: {self._scorer.lines_cleared}")
@@ -69,8 +109,20 @@ The possible commands are:
         Shows the instructions to the player
         :return: None
         """
+        self._reset_screen()
         print(self._INSTRUCTIONS)
 
+    def _reset_screen(self) -> None:
+        """
+        Clears the terminal and forgets the diff state, so whatever is
+        printed next starts from the top and the following frame is a
+        full redraw
+        :return: None
+        """
+        self._prev_lines = []
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+
     def quit(self) -> None:
         """
         Ends the session
@@ -31,48 +31,96 @@ class PlayGrid:
         self._width = self._board.width * self._block_size
         self._height = self._board.height * self._block_size
         self._engine = engine
+        sx, sy = position
+        # cell rects never move, so build them once instead of computing
+        # sx + j * block_size for every cell on every frame
+        self._cell_rects = [
+            [
+                pygame.Rect(sx + j * block_size, sy + i * block_size, block_size, block_size)
+                for j in range(self._board.width)
+            ]
+            for i in range(self._board.height)
+        ]
+        # The grid lines are static, so rasterise them once into a
+        # transparent overlay and blit that per frame instead of issuing
+        # ~30 draw.line calls
+        self._grid_overlay = self._build_grid_overlay()
+
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """
+        Draws the static parts of the grid onto a background surface
+        :param surface: the surface to draw onto
+        :return: None
+        """
+        sx, sy = self._position
+        # Empty cells are baked into the background, so the per-frame
+        # tetrimino pass only has to touch occupied cells
+        surface.fill(PIECE_COLOURS_RGB[0], (sx, sy, self._width, self._height))
+        self._draw_border(surface)
 
     def draw(self) -> None:
         self._draw_tetriminoes()
-        self._draw_grid_lines()
-        self._draw_border()
+        self._surface.blit(self._grid_overlay, self._position)
         self._draw_active_piece_highlights()
 
     def _draw_tetriminoes(self):
-        sx, sy = self._position
-        for i in range(self._board.height):
-            for j in range(self._board.width):
-                pygame.draw.rect(
-                    surface=self._surface,
-                    color=PIECE_COLOURS_RGB[self._board.value_at(i, j)],
-                    rect=(sx + j * self._block_size, sy + i * self._block_size, self._block_size, self._block_size),
-                    width=0,
-                )
-
-    def _draw_grid_lines(self) -> None:
+        # Bind everything touched inside the loop to locals; LOAD_FAST is
+        # measurably cheaper than attribute lookups in a per-cell loop
+        board = self._board
+        row_occupancy = board.row_occupancy
+        value_at = board.value_at
+        width = board.width
+        cell_rects = self._cell_rects
+        colours = PIECE_COLOURS_RGB
+        fill = self._surface.fill
+        for i in range(board.height):
+            # The row occupancy mask lets us skip empty rows (most of the
+            # board, early game) without probing every cell
+            mask = row_occupancy(i)
+            if not mask:
+                continue
+            row_rects = cell_rects[i]
+            # Merge horizontal runs of the same colour into one fill each;
+            # tetriminoes and cleared-line stacks make runs of 2+ common
+            j = 0
+            while j < width:
+                if not (mask >> j) & 1:
+                    j += 1
+                    continue
+                v = value_at(i, j)
+                start = j
+                j += 1
+                while j < width and (mask >> j) & 1 and value_at(i, j) == v:
+                    j += 1
+                first = row_rects[start]
+                fill(colours[v], (first.x, first.y, first.width * (j - start), first.height))
+
+    def _build_grid_overlay(self) -> pygame.Surface:
         """
-        Draws the grey grid lines that we see
-        :return: None
+        Draws the grey grid lines that we see, once, onto a transparent overlay
+        :return: the overlay surface containing just the grid lines
         """
-        sx, sy = self._position
+        overlay = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
         for i in range(self._board.height):
             pygame.draw.line(
-                self._surface,
+                overlay,
                 GREY_COLOUR,
-                (sx, sy + i * self._block_size),
-                (sx + self._width - 1, sy + i * self._block_size),
+                (0, i * self._block_size),
+                (self._width - 1, i * self._block_size),
             )  # horizontal lines
-            for j in range(self._board.width):
-                pygame.draw.line(
-                    self._surface,
-                    GREY_COLOUR,
-                    (sx + j * self._block_size, sy),
-                    (sx + j * self._block_size, sy + self._height - 1),
-                )  # vertical line
-
-    def _draw_border(self) -> None:
+        for j in range(self._board.width):
+            pygame.draw.line(
+                overlay,
+                GREY_COLOUR,
+                (j * self._block_size, 0),
+                (j * self._block_size, self._height - 1),
+            )  # vertical lines
+        # Converting to the display format keeps blits on SDL's fast path
+        return overlay.convert_alpha()
+
+    def _draw_border(self, surface: pygame.Surface) -> None:
         sx, sy = self._position
-        pygame.draw.rect(surface=self._surface, color=RED_COLOUR, rect=(sx, sy, self._width, self._height), width=2)
+        pygame.draw.rect(surface=surface, color=RED_COLOUR, rect=(sx, sy, self._width, self._height), width=2)
 
     def _draw_active_piece_highlights(self):
         active_piece: Piece = self._engine.active_piece
@@ -95,13 +143,15 @@ class PlayGrid:
         # )  # vertical line
 
         points = active_piece.lowest_possible_position()
+        bs = self._block_size
+        colour = PIECE_COLOURS_RGB[active_piece.piece_index]
         for p in points:
             row_idx = (p.y - ROW_PADDING)
             if row_idx >= 0:
                 pygame.draw.rect(
                     surface=self._surface,
-                    color=PIECE_COLOURS_RGB[active_piece.piece_index],
-                    rect=(sx + p.x * self._block_size, sy + row_idx * self._block_size, self._block_size, self._block_size),
+                    color=colour,
+                    rect=(sx + p.x * bs, sy + row_idx * bs, bs, bs),
                     width=2,
                 )
 
@@ -125,6 +175,7 @@ class InterfacePygame(Interface):
     _font_name = "freesans"
     _holdable_keys = {pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT}
     _hold_threshold_ms = 120
+    _LABEL_CACHE_SIZE = 256
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -132,6 +183,10 @@ class InterfacePygame(Interface):
         pygame.display.init()
         pygame.font.init()
         pygame.display.set_caption("Tetris")
+        # We only ever read quit and key events, so let SDL drop everything
+        # else at the source instead of filtering in Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN))
         biggest_screen = sorted(pygame.display.get_desktop_sizes(), reverse=True)[0]
         self._block_size = biggest_screen[1] // self._BLOCK_SCALE_FACTOR
 
@@ -159,7 +214,7 @@ class InterfacePygame(Interface):
         ## Screen Dimensions
         self._screen_width = (self._section_width * 3) + 4 * self._section_horizontal_padding
         # 1.5 vertical padding here for 1 at the top and 0.5 at the bottom of the screen (i.e. less space at the bottom)
-        self._screen_height = self._section_height + 1.5 * self._section_vertical_padding
+        self._screen_height = int(self._section_height + 1.5 * self._section_vertical_padding)
         self._screen_size = (self._screen_width, self._screen_height)
         self._screen = pygame.display.set_mode(self._screen_size)
 
@@ -168,7 +223,7 @@ class InterfacePygame(Interface):
         self._stats_box_height = self._section_height
         self._stats_box_top_left_x = self._section_horizontal_padding
         self._stats_box_top_left_y = self._section_top_left_y
-        self._stats_title = self._title_font.render("STATISTICS", 1, YELLOW_COLOUR)
+        self._stats_title = self._title_font.render("STATISTICS", 1, YELLOW_COLOUR).convert_alpha()
 
         ## Play grid section
         grid_top_left_x = self._stats_box_top_left_x + self._stats_box_width + self._section_horizontal_padding
@@ -183,29 +238,215 @@ class InterfacePygame(Interface):
         self._info_box_top_left_y = self._section_top_left_y
 
         # LABELS
-        self._title_label = self._title_font.render("TETRIS", 1, WHITE_COLOUR)
+        self._title_label = self._title_font.render("TETRIS", 1, WHITE_COLOUR).convert_alpha()
+
+        self._next_piece_label = self._subtitle_font.render("NEXT PIECE", 1, WHITE_COLOUR).convert_alpha()
+
+        ## Next piece preview layout; static, so computed once here rather
+        ## than on every frame
+        self._np_label_x = int(self._info_box_top_left_x + self._info_box_width // 2 - self._next_piece_label.get_width() / 2)
+        self._np_label_y = self._info_box_top_left_y + self._block_size * 6
+        np_blocks_width = 6
+        np_blocks_height = 2
+        self._np_box_w = np_blocks_width * self._block_size
+        self._np_box_h = np_blocks_height * self._block_size
+        self._np_box_x = int(self._np_label_x + (self._next_piece_label.get_width() - self._np_box_w) / 2)
+        self._np_box_y = int(self._np_label_y + self._block_size * 1.5)
+        self._np_separator_y = int(self._np_box_y + (np_blocks_height + 1) * self._block_size)
+
+        ## One pre-rendered preview sprite per piece type: box background,
+        ## minos, grid lines and border baked into a single surface, so the
+        ## per-frame preview draw is one blit
+        self._np_sprites = {}
+        bs = self._block_size
+        for shape in SHAPE_POSSIBILITIES:
+            sprite = pygame.Surface((self._np_box_w, self._np_box_h)).convert()
+            sprite.fill(DARK_GREY_COLOUR)
+            blocks, _ = shape.points_from_top_left(MinoPoint(2, 0))
+            colour = PIECE_COLOURS_RGB[shape.piece_index]
+            for b in blocks:
+                sprite.fill(colour, (b.x * bs, b.y * bs, bs, bs))
+            for i in range(np_blocks_height):
+                pygame.draw.line(sprite, GREY_COLOUR, (0, i * bs), (self._np_box_w, i * bs))
+            for j in range(np_blocks_width):
+                pygame.draw.line(sprite, GREY_COLOUR, (j * bs, 0), (j * bs, self._np_box_h))
+            pygame.draw.rect(sprite, GREY_COLOUR, (0, 0, self._np_box_w, self._np_box_h), 1)
+            self._np_sprites[shape] = sprite
+
+        self._paused_label = self._subtitle_font.render("PAUSED", 1, ORANGE_COLOUR).convert_alpha()
+        self._paused_label_top_left_x = int(self._info_box_top_left_x + self._info_box_width // 2 - self._paused_label.get_width() / 2)
+        self._paused_label_top_left_y = int(self._info_box_top_left_y + self._info_box_height - 1.5 * self._block_size)
+
+        self._game_over_label = self._title_font.render("GAME OVER", 1, RED_COLOUR).convert_alpha()
+        self._last_holdable_key_event_time = 0
 
-        self._next_piece_label = self._subtitle_font.render("NEXT PIECE", 1, WHITE_COLOUR)
+        # The instructions text and layout never change, so render and
+        # position every label once
+        instrs_label = self._subtitle_font.render("INSTRUCTIONS", 1, WHITE_COLOUR).convert_alpha()
+        instr_x = self._info_box_top_left_x + self._block_size
+        instr_y = int(self._info_box_top_left_y + self._info_box_height * 0.55)
+        self._instruction_blits = [
+            (
+                instrs_label,
+                (int(self._info_box_top_left_x + self._info_box_width / 2 - instrs_label.get_width() / 2), instr_y),
+            )
+        ]
+        lines_y = instr_y + instrs_label.get_height() * 1.5
+        text_height = self._text_font.get_height()
+        for i, l in enumerate(self._INSTRUCTIONS):
+            label = self._text_font.render(l, 1, WHITE_COLOUR).convert_alpha()
+            self._instruction_blits.append((label, (instr_x, int(lines_y + text_height * i * 1.2))))
 
-        self._paused_label = self._subtitle_font.render("PAUSED", 1, ORANGE_COLOUR)
-        self._paused_label_top_left_x = self._info_box_top_left_x + self._info_box_width // 2 - self._paused_label.get_width() / 2
-        self._paused_label_top_left_y = self._info_box_top_left_y + self._info_box_height - 1.5 * self._block_size
+        # Rendered-label cache, keyed by (font, text, colour); glyph
+        # rasterisation is the dominant per-frame cost otherwise
+        self._label_cache = {}
 
-        self._game_over_label = self._title_font.render("GAME OVER", 1, RED_COLOUR)
-        self._last_holdable_key_event_time = 0
+        # Fingerprint of the last frame drawn, so identical frames are skipped
+        self._last_drawn_state = None
+
+        # Statistics labels, rebuilt only when the statistics version moves
+        self._stats_labels_version = None
+        self._stats_labels: List[pygame.Surface] = []
+
+        # Static background: fill, title and grid border never change,
+        # so render them once and blit the result every frame
+        self._bg = pygame.Surface((int(self._screen_width), int(self._screen_height))).convert()
+        self._bg.fill(DARK_GREY_COLOUR)
+        self._bg.blit(
+            self._title_label,
+            (
+                self._screen_width / 2 - (self._title_label.get_width() / 2),
+                self._block_size,
+            ),
+        )
+        self._grid.draw_background(self._bg)
+
+        # The info and statistics chrome (borders, separators, section
+        # titles, instructions) is static too, so bake it into the
+        # background; the per-frame draws only add the dynamic labels
+        ## Info section border and instructions
+        pygame.draw.rect(
+            surface=self._bg,
+            color=GREY_COLOUR,
+            rect=(self._info_box_top_left_x, self._info_box_top_left_y, self._info_box_width, self._info_box_height),
+            width=1
+        )
+        self._bg.blits(self._instruction_blits, doreturn=False)
+
+        ## Score label positions and the separator below them
+        self._score_stats_x = self._info_box_top_left_x + self._block_size
+        self._score_y = self._info_box_top_left_y + self._block_size
+        self._lines_y = self._score_y + self._block_size
+        self._level_y = self._lines_y + self._block_size
+        score_separator_y = self._level_y + self._subtitle_font.get_height() + self._score_y - self._info_box_top_left_y
+        pygame.draw.line(
+            self._bg,
+            GREY_COLOUR,
+            (self._info_box_top_left_x, score_separator_y),
+            (self._info_box_top_left_x + self._info_box_width, score_separator_y),
+        )
+
+        ## Next-piece label and the separator below the preview box
+        # TODO: next piece section isn't vertically central in its box right now
+        self._bg.blit(self._next_piece_label, (self._np_label_x, self._np_label_y))
+        pygame.draw.line(
+            self._bg,
+            GREY_COLOUR,
+            (self._info_box_top_left_x, self._np_separator_y),
+            (self._info_box_top_left_x + self._info_box_width, self._np_separator_y),
+        )
+
+        ## Line above the pause box
+        pause_separator_y = self._paused_label_top_left_y - (self._info_box_top_left_y + self._info_box_height - (
+                    self._paused_label_top_left_y + self._paused_label.get_height()))
+        pygame.draw.line(
+            self._bg,
+            GREY_COLOUR,
+            (self._info_box_top_left_x, pause_separator_y),
+            (self._info_box_top_left_x + self._info_box_width, pause_separator_y)
+        )
+
+        ## Statistics border, title and the separator beneath it
+        pygame.draw.rect(
+            surface=self._bg,
+            color=GREY_COLOUR,
+            rect=(self._stats_box_top_left_x, self._stats_box_top_left_y, self._stats_box_width, self._stats_box_height),
+            width=1
+        )
+        self._stats_middle = self._stats_box_top_left_x + self._stats_box_width / 2
+        stats_title_y = self._stats_box_top_left_y + self._block_size * 0.7
+        self._bg.blit(
+            self._stats_title,
+            (int(self._stats_middle - self._stats_title.get_width() / 2), int(stats_title_y)),
+        )
+        stats_line_y = stats_title_y + self._stats_title.get_height() + self._block_size * 0.7
+        pygame.draw.line(
+            self._bg,
+            GREY_COLOUR,
+            (self._stats_box_top_left_x, stats_line_y),
+            (self._stats_box_top_left_x + self._stats_box_width, stats_line_y),
+        )
+        self._stats_rows_y = stats_line_y + self._block_size * 0.5
+
+        # Section rects used for partial display updates
+        self._grid_rect = pygame.Rect(
+            grid_top_left_x, grid_top_left_y, self._section_width, self._section_height
+        )
+        self._info_rect = pygame.Rect(
+            int(self._info_box_top_left_x),
+            int(self._info_box_top_left_y),
+            int(self._info_box_width),
+            int(self._info_box_height),
+        )
+        self._stats_rect = pygame.Rect(
+            int(self._stats_box_top_left_x),
+            int(self._stats_box_top_left_y),
+            int(self._stats_box_width),
+            int(self._stats_box_height),
+        )
 
     def draw_screen(self) -> None:
         """
         Draws the main gameplay screen
         :return: None
         """
-        self._screen.fill(DARK_GREY_COLOUR)
-        self._draw_title()
-        self._grid.draw()
-        self._draw_info_section()
-        self._draw_statistics_section()
-
-        pygame.display.update()
+        board_state = self._board.version
+        info_state = (
+            self._scorer.score,
+            self._scorer.lines_cleared,
+            self._scorer.level,
+            self._piece_generator.next_piece_type,
+            self._statistics.version,
+        )
+        prev = self._last_drawn_state
+        if prev == (board_state, info_state):
+            return
+        self._last_drawn_state = (board_state, info_state)
+
+        if prev is None:
+            # First frame (or invalidated screen): draw everything
+            self._screen.blit(self._bg, (0, 0))
+            self._grid.draw()
+            self._draw_info_section()
+            self._draw_statistics_section()
+            pygame.display.update()
+            return
+
+        # Only repaint (and push to the window) the sections that changed
+        prev_board_state, prev_info_state = prev
+        dirty = []
+        if board_state != prev_board_state:
+            self._screen.blit(self._bg, self._grid_rect, self._grid_rect)
+            self._grid.draw()
+            dirty.append(self._grid_rect)
+        if info_state != prev_info_state:
+            self._screen.blit(self._bg, self._info_rect, self._info_rect)
+            self._screen.blit(self._bg, self._stats_rect, self._stats_rect)
+            self._draw_info_section()
+            self._draw_statistics_section()
+            dirty.append(self._info_rect)
+            dirty.append(self._stats_rect)
+        pygame.display.update(dirty)
 
     def get_input(self) -> List[Command]:
         """
@@ -214,21 +455,20 @@ class InterfacePygame(Interface):
         """
         key_states = pygame.key.get_pressed()
         cmds = []
-        events = pygame.event.get()
+        events = pygame.event.get(eventtype=(pygame.QUIT, pygame.KEYDOWN))
         for event in events:
-            ev_type = event.type
-            if ev_type == pygame.QUIT:
+            if event.type == pygame.QUIT:
                 cmds.append(Command.QUIT)
                 break
-            elif ev_type == pygame.KEYDOWN and event.key in pygame_key_mapping:
-                cmds.append(Command.from_pygame_key(event.key))
+            cmd = pygame_key_mapping.get(event.key)
+            if cmd is not None:
+                cmds.append(cmd)
                 if event.key in self._holdable_keys:
                     self._last_holdable_key_event_time = time.time_ns()
 
         for key in self._holdable_keys:
             if key_states[key] and (time.time_ns() - self._last_holdable_key_event_time) * 1e-6 > self._hold_threshold_ms:
-                cmd = Command.from_pygame_key(key)
-                cmds.append(cmd)
+                cmds.append(pygame_key_mapping[key])
 
         return cmds
 
@@ -238,12 +478,14 @@ class InterfacePygame(Interface):
         :return: None
         """
         self._screen.fill(BLACK_COLOUR)
+        # The whole screen needs redrawing once a new game starts
+        self._last_drawn_state = None
         # Title
         self._screen.blit(
             self._game_over_label,
             (
-                self._screen_width / 2 - (self._game_over_label.get_width() / 2),
-                self._screen_height * 0.4
+                self._screen_width // 2 - self._game_over_label.get_width() // 2,
+                int(self._screen_height * 0.4),
             ),
         )
         self._draw_game_over_text()
@@ -255,16 +497,7 @@ class InterfacePygame(Interface):
         Shows the instructions to the player
         :return: None
         """
-        instrs_label = self._subtitle_font.render("INSTRUCTIONS", 1, WHITE_COLOUR)
-        top_left_x = self._info_box_top_left_x + self._block_size
-        instr_top_left_y = self._info_box_top_left_y + self._info_box_height * 0.55
-        self._screen.blit(instrs_label,(self._info_box_top_left_x + self._info_box_width / 2 - instrs_label.get_width() / 2, instr_top_left_y))
-        sy = instr_top_left_y + instrs_label.get_height() * 1.5
-        for i, l in enumerate(self._INSTRUCTIONS):
-            top_left_y = sy + self._text_font.get_height() * i * 1.2
-            self._text_font.get_height()
-            label = self._text_font.render(l, 1, WHITE_COLOUR)
-            self._screen.blit(label, (top_left_x, top_left_y))
+        self._screen.blits(self._instruction_blits, doreturn=False)
 
 
     def quit(self) -> None:
@@ -275,14 +508,24 @@ class InterfacePygame(Interface):
         pygame.display.quit()
         pygame.font.quit()
 
-    def _draw_title(self) -> None:
-        self._screen.blit(
-            self._title_label,
-            (
-                self._screen_width / 2 - (self._title_label.get_width() / 2),
-                self._block_size,
-            ),
-        )
+    def _render_label(self, font: pygame.font.Font, text: str, colour: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Renders a text label, reusing a cached surface when the same
+        text/font/colour was rendered before
+        :param font: the font to render with
+        :param text: the label text
+        :param colour: the text colour
+        :return: the rendered label surface
+        """
+        key = (id(font), text, colour)
+        label = self._label_cache.get(key)
+        if label is None:
+            # The score and percentage strings churn over a long session, so
+            # bound the cache rather than hold every label ever rendered
+            if len(self._label_cache) >= self._LABEL_CACHE_SIZE:
+                self._label_cache.clear()
+            label = self._label_cache[key] = font.render(text, 1, colour).convert_alpha()
+        return label
 
     def show_paused(self) -> None:
         """
@@ -291,156 +534,52 @@ class InterfacePygame(Interface):
         """
 
         self._screen.blit(self._paused_label, (self._paused_label_top_left_x, self._paused_label_top_left_y))
+        # The pause label must be painted over on the next frame
+        self._last_drawn_state = None
         pygame.display.update()
 
     def _draw_info_section(self) -> None:
-        # Border
-        pygame.draw.rect(
-            surface=self._screen,
-            color=GREY_COLOUR,
-            rect=(self._info_box_top_left_x, self._info_box_top_left_y, self._info_box_width, self._info_box_height),
-            width=1
-        )
+        # The border, separators and instructions are baked into the
+        # background, so only the dynamic parts are drawn here
         self._draw_score_stats()
         self._draw_next_piece_section()
-        self.show_instructions()
-
-        # Line above pause box
-        pause_box_line_separator_y = self._paused_label_top_left_y - (self._info_box_top_left_y + self._info_box_height - (
-                    self._paused_label_top_left_y + self._paused_label.get_height()))
-        pygame.draw.line(
-            self._screen,
-            GREY_COLOUR,
-            (self._info_box_top_left_x, pause_box_line_separator_y),
-            (self._info_box_top_left_x + self._info_box_width, pause_box_line_separator_y)
-
-        )
 
     def _draw_score_stats(self) -> None:
-        score_label = self._subtitle_font.render(
-            f"SCORE: {self._scorer.score}",
-            1,
-            WHITE_COLOUR,
-        )
-        lines_label = self._subtitle_font.render(
-            f"LINES CLEARED: {self._scorer.lines_cleared}",
-            1,
-            WHITE_COLOUR,
-        )
-        level_label = self._subtitle_font.render(
-            f"LEVEL: {self._scorer.level}",
-            1,
-            WHITE_COLOUR,
-        )
-        top_left_x = self._info_box_top_left_x + self._block_size
-        score_top_left_y = self._info_box_top_left_y + self._block_size
-        lines_top_left_y = score_top_left_y + self._block_size
-        level_top_left_y = lines_top_left_y + self._block_size
-        self._screen.blit(score_label, (top_left_x, score_top_left_y))
-        self._screen.blit(lines_label, (top_left_x, lines_top_left_y))
-        self._screen.blit(level_label, (top_left_x, level_top_left_y))
-
-        sec_separator_line_y = level_top_left_y + level_label.get_height() + score_top_left_y - self._info_box_top_left_y
-        pygame.draw.line(
-            self._screen,
-            GREY_COLOUR,
-            (self._info_box_top_left_x, sec_separator_line_y),
-            (self._info_box_top_left_x + self._info_box_width, sec_separator_line_y),
-        )
+        score_label = self._render_label(self._subtitle_font, f"SCORE: {self._scorer.score}", WHITE_COLOUR)
+        lines_label = self._render_label(self._subtitle_font, f"LINES CLEARED: {self._scorer.lines_cleared}", WHITE_COLOUR)
+        level_label = self._render_label(self._subtitle_font, f"LEVEL: {self._scorer.level}", WHITE_COLOUR)
+        self._screen.blit(score_label, (self._score_stats_x, self._score_y))
+        self._screen.blit(lines_label, (self._score_stats_x, self._lines_y))
+        self._screen.blit(level_label, (self._score_stats_x, self._level_y))
 
     def _draw_next_piece_section(self) -> None:
-        label_top_left_x = self._info_box_top_left_x + self._info_box_width // 2 - self._next_piece_label.get_width() / 2
-        label_top_left_y = self._info_box_top_left_y + self._block_size * 6
-        self._screen.blit(self._next_piece_label, (label_top_left_x, label_top_left_y))
-
-        num_blocks_width = 6
-        num_blocks_height = 2
-        box_width = num_blocks_width * self._block_size
-        box_height = num_blocks_height * self._block_size
-        box_top_left_x = label_top_left_x + (self._next_piece_label.get_width() - box_width) / 2
-        box_top_left_y = label_top_left_y + self._block_size * 1.5
-
-        pygame.draw.rect(
-            surface=self._screen,
-            color=GREY_COLOUR,
-            rect=(box_top_left_x, box_top_left_y, box_width, box_height),
-            width=1
-        )
-        next_piece_type = self._piece_generator.next_piece_type
-        blocks, _ = next_piece_type.points_from_top_left(MinoPoint(2, 0))
-
-        # Minos
-        for block in blocks:
-            pygame.draw.rect(
-                surface=self._screen,
-                color=PIECE_COLOURS_RGB[next_piece_type.piece_index],
-                rect=(box_top_left_x + block.x * self._block_size, box_top_left_y + block.y * self._block_size, self._block_size, self._block_size),
-                width=0,
-            )
-
-        # Grid lines
-        for i in range(num_blocks_height):
-            pygame.draw.line(
-                self._screen,
-                GREY_COLOUR,
-                (box_top_left_x, box_top_left_y + i * self._block_size),
-                (box_top_left_x + box_width, box_top_left_y + i * self._block_size),
-            )  # horizontal lines
-            for j in range(num_blocks_width):
-                pygame.draw.line(
-                    self._screen,
-                    GREY_COLOUR,
-                    (box_top_left_x + j * self._block_size, box_top_left_y),
-                    (box_top_left_x + j * self._block_size, box_top_left_y + box_height),
-                )  # vertical line
-
-        # TODO: next piece section isn't vertically central in its box right now
-        separator_line_y = box_top_left_y + (num_blocks_height + 1) * self._block_size
-        pygame.draw.line(
-            self._screen,
-            GREY_COLOUR,
-            (self._info_box_top_left_x, separator_line_y),
-            (self._info_box_top_left_x + self._info_box_width, separator_line_y),
-        )
-
-    def _draw_statistics_section(self) -> None:
-        # Border
-        pygame.draw.rect(
-            surface=self._screen,
-            color=GREY_COLOUR,
-            rect=(self._stats_box_top_left_x, self._stats_box_top_left_y, self._stats_box_width, self._stats_box_height),
-            width=1
-        )
-
-        # Title
-        stats_box_middle = self._stats_box_top_left_x + self._stats_box_width / 2
-        stats_title_y = self._stats_box_top_left_y + self._block_size * 0.7
-        stats_title_x = stats_box_middle - self._stats_title.get_width() / 2
         self._screen.blit(
-            self._stats_title,
-            (
-                stats_title_x,
-                stats_title_y,
-            )
-        )
-        line_y = stats_title_y + self._stats_title.get_height() + self._block_size * 0.7
-        pygame.draw.line(
-            self._screen,
-            GREY_COLOUR,
-            (self._stats_box_top_left_x, line_y),
-            (self._stats_box_top_left_x + self._stats_box_width, line_y),
+            self._np_sprites[self._piece_generator.next_piece_type],
+            (self._np_box_x, self._np_box_y),
         )
 
-        # The shape statistics
+    def _draw_statistics_section(self) -> None:
+        # The border, title and separator are baked into the background;
+        # only the shape counts are drawn here, and their labels are
+        # rebuilt only when the counts change
+        stats_box_middle = self._stats_middle
         spacial_factor = 1.3
-        sy = line_y + self._block_size * 0.5
-        counts = self._statistics.shape_counts.copy()
-        total = sum(counts.values())
-        for i, shape in enumerate(SHAPE_POSSIBILITIES):
-            letter = shape.letter
-            shape_count = counts[letter]
-            perc = 0 if total == 0 else round(shape_count / total * 100, 1)
-            label = self._title_font.render(f"{letter}: {shape_count} ({perc}%)", 1, PIECE_COLOURS_RGB[shape.piece_index])
+        sy = self._stats_rows_y
+        version = self._statistics.version
+        if version != self._stats_labels_version:
+            counts = self._statistics.shape_counts
+            total = sum(counts.values())
+            self._stats_labels = [
+                self._render_label(
+                    self._title_font,
+                    f"{shape.letter}: {counts[shape.letter]} "
+                    f"({0 if total == 0 else round(counts[shape.letter] / total * 100, 1)}%)",
+                    PIECE_COLOURS_RGB[shape.piece_index],
+                )
+                for shape in SHAPE_POSSIBILITIES
+            ]
+            self._stats_labels_version = version
+        for i, label in enumerate(self._stats_labels):
             self._screen.blit(
                 label,
                 (
@@ -450,27 +589,30 @@ class InterfacePygame(Interface):
             )
 
     def _draw_game_over_text(self) -> None:
-        score_label = self._subtitle_font.render(f"FINAL SCORE: {self._scorer.score}", 1, WHITE_COLOUR)
+        # Integer coordinates keep the labels pixel-aligned and save pygame
+        # a float conversion per blit
+        centre_x = self._screen_width // 2
+        score_label = self._render_label(self._subtitle_font, f"FINAL SCORE: {self._scorer.score}", WHITE_COLOUR)
         score_label_pos = (
-                self._screen_width / 2 - (score_label.get_width() / 2),
-                self._screen_height * 0.5
+                centre_x - score_label.get_width() // 2,
+                self._screen_height // 2,
             )
-        lines_label = self._subtitle_font.render(f"LINES CLEARED: {self._scorer.lines_cleared}", 1, WHITE_COLOUR)
+        lines_label = self._render_label(self._subtitle_font, f"LINES CLEARED: {self._scorer.lines_cleared}", WHITE_COLOUR)
         lines_label_pos = (
-                self._screen_width / 2 - (lines_label.get_width() / 2),
-                score_label_pos[1] + score_label.get_height() * 1.5,
+                centre_x - lines_label.get_width() // 2,
+                int(score_label_pos[1] + score_label.get_height() * 1.5),
             )
-        level_label = self._subtitle_font.render(f"LEVEL: {self._scorer.level}", 1, WHITE_COLOUR)
+        level_label = self._render_label(self._subtitle_font, f"LEVEL: {self._scorer.level}", WHITE_COLOUR)
         level_label_pos = (
-                self._screen_width / 2 - (level_label.get_width() / 2),
-                lines_label_pos[1] + lines_label.get_height() * 1.5,
+                centre_x - level_label.get_width() // 2,
+                int(lines_label_pos[1] + lines_label.get_height() * 1.5),
             )
         self._screen.blit(score_label, score_label_pos)
         self._screen.blit(lines_label, lines_label_pos)
         self._screen.blit(level_label, level_label_pos)
-        instrs = self._text_font.render(f"TO START A NEW GAME, PRESS 'R'. TO QUIT, PRESS 'Q'.", 1, YELLOW_COLOUR)
+        instrs = self._render_label(self._text_font, "TO START A NEW GAME, PRESS 'R'. TO QUIT, PRESS 'Q'.", YELLOW_COLOUR)
         instrs_pos = (
-                self._screen_width / 2 - (instrs.get_width() / 2),
+                centre_x - instrs.get_width() // 2,
                 level_label_pos[1] + level_label.get_height() * 2,
         )
         self._screen.blit(instrs, instrs_pos)
@@ -2,7 +2,7 @@
 # For details: https://github.com/tomapopov/tetris-py/blob/main/NOTICE
 
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Set, Type
+from typing import Tuple, List, Optional, Set, Type
 import random
 
 from .direction import Direction
@@ -21,7 +21,7 @@ from .colours import (
 )
 from .point import Point, MinoPoint, rotate_point_90
 
-PIECE_COLOURS_ANSI = [
+PIECE_COLOURS_ANSI = (
     "\033[37m{}\033[00m",  # white, for empty spaces
     "\033[96m{}\033[00m",
     "\033[95m{}\033[00m",
@@ -30,9 +30,9 @@ PIECE_COLOURS_ANSI = [
     "\033[91m{}\033[00m",
     "\033[34m{}\033[00m",
     "\033[35m{}\033[00m",
-]
+)
 
-PIECE_COLOURS_RGB = [
+PIECE_COLOURS_RGB = (
     BLACK_COLOUR,
     CYAN_COLOUR,
     PINK_COLOUR,
@@ -40,16 +40,46 @@ PIECE_COLOURS_RGB = [
     GREEN_COLOUR,
     RED_COLOUR,
     BLUE_COLOUR,
-    PURPLE_COLOUR
-]
+    PURPLE_COLOUR,
+)
 
 
 class Piece(ABC):
+    # Static block offsets from the top-left block and the rotational centre
+    # offset, so spawning a piece is pure arithmetic over constant tuples
+    _SHAPE_OFFSETS: Tuple[Tuple[int, int], ...]
+    _CENTRE_OFFSET: Tuple[float, float]
+    # Per-class table of the four rotation states, built on first use
+    _ROTATION_STATES: Optional[Tuple[Tuple[Tuple[float, float], ...], ...]] = None
+
     def __init__(self, board: "board.Board", top_left: MinoPoint):
         ps, c = self.points_from_top_left(top_left)
         self._points: List[MinoPoint] = ps
         self._centre: Point = c
         self._board = board
+        self._rotation_state = 0
+        cls = type(self)
+        if cls._ROTATION_STATES is None:
+            cls._ROTATION_STATES = cls._build_rotation_states()
+        # Lazily-built column/row sets, invalidated whenever the piece moves
+        self._columns: Optional[Set[int]] = None
+        self._rows: Optional[Set[int]] = None
+
+    @classmethod
+    def _build_rotation_states(cls) -> Tuple[Tuple[Tuple[float, float], ...], ...]:
+        """
+        Precomputes the four rotation states as block offsets from the
+        rotational centre, so rotating becomes a table lookup plus additions
+        :return: tuple of four offset tuples, indexed by rotation state
+        """
+        cx, cy = cls._CENTRE_OFFSET
+        offsets = tuple((dx - cx, dy - cy) for dx, dy in cls._SHAPE_OFFSETS)
+        states = [offsets]
+        for _ in range(3):
+            # Same 90-degree transform rotate_point_90 applies: (x, y) -> (-y, x)
+            offsets = tuple((-dy, dx) for dx, dy in offsets)
+            states.append(offsets)
+        return tuple(states)
 
     @property
     def points(self) -> List[MinoPoint]:
@@ -59,28 +89,33 @@ class Piece(ABC):
         return self._points
 
     @classmethod
-    @abstractmethod
     def points_from_top_left(cls, top_left: MinoPoint) -> Tuple[List[MinoPoint], Point]:
         """
         Calculates the blocks and rotational centre from the top left block coordinate
         :param top_left: the top left block coordinate
         :return: Tuple of: list of block coordinates for the piece, and the rotational centre
         """
-        pass
+        x, y = top_left.x, top_left.y
+        points = [MinoPoint(x + dx, y + dy) for dx, dy in cls._SHAPE_OFFSETS]
+        cx, cy = cls._CENTRE_OFFSET
+        return points, Point(x + cx, y + cy)
 
     def rotate(self) -> None:
         """
         Rotates the piece on the board, if possible
         :return: None
         """
-        self._board._remove_piece(self)
-        self._rotate()
-        if self._board.can_add_piece(self):
-            self._board.add_piece(self)
-            return
-        # If the rotation isn't possible, undo it
-        self._rotate(reverse=True)
-        self._board.add_piece(self)
+        next_state = (self._rotation_state + 1) & 3
+        cx, cy = self._centre.x, self._centre.y
+        new_points = [
+            MinoPoint(int(cx + dx), int(cy + dy))
+            for dx, dy in self._ROTATION_STATES[next_state]
+        ]
+        if self._board.can_move_piece(self, new_points):
+            self._board.update_piece_location(self, new_points)
+            self._points = new_points
+            self._rotation_state = next_state
+            self._columns = self._rows = None
 
     def move(self, direction: Direction) -> bool:
         """
@@ -88,22 +123,14 @@ class Piece(ABC):
         :param direction: Direction
         :return: True if the piece moved successfully, False otherwise
         """
-        self._board._remove_piece(self)
-        self._move(direction)
-        if self._board.can_add_piece(self):
-            self._board.add_piece(self)
-            return True
-        # If the move isn't possible, undo it
-        self._move(direction.opposite)
-        self._board.add_piece(self)
-        return False
-
-    def _move(self, direction: Direction) -> None:
-        self._points = [p.shift(direction) for p in self._points]
+        new_points = [p.shift(direction) for p in self._points]
+        if not self._board.can_move_piece(self, new_points):
+            return False
+        self._board.update_piece_location(self, new_points)
+        self._points = new_points
         self._centre = self._centre.shift(direction)
-
-    def _rotate(self, reverse: bool = False):
-        self._points = [rotate_point_90(p, self._centre, reverse=reverse) for p in self._points]
+        self._columns = self._rows = None
+        return True
 
     def can_shift_down(self) -> bool:
         """
@@ -131,7 +158,9 @@ class Piece(ABC):
         The columns taken up by all the blocks that make up the piece
         :return: set of integer columns
         """
-        return set(p.x for p in self._points)
+        if self._columns is None:
+            self._columns = set(p.x for p in self._points)
+        return self._columns
 
     @property
     def rows(self) -> Set[int]:
@@ -139,7 +168,9 @@ class Piece(ABC):
         The rows taken up by all the blocks that make up the piece
         :return: set of integer rows
         """
-        return set(p.y for p in self._points)
+        if self._rows is None:
+            self._rows = set(p.y for p in self._points)
+        return self._rows
 
     def _lowest_block_in_col(self, col: int) -> MinoPoint:
         """
@@ -147,10 +178,11 @@ class Piece(ABC):
         :param col: column value
         :return: coordinate of the lowest block in the given column for this piece
         """
-        max_y = max(p.y for p in self._points if p.x == col)
-        matches = [p for p in self._points if p.x == col and p.y == max_y]
-        assert len(matches) == 1, f"How did we not find the lowest piece in col {col!r}?!"
-        return matches[0]
+        lowest = None
+        for p in self._points:
+            if p.x == col and (lowest is None or p.y > lowest.y):
+                lowest = p
+        return lowest
 
     @classmethod
     @property
@@ -168,123 +200,72 @@ class Piece(ABC):
 class IPiece(Piece):
     piece_index: int = 1
     letter: str = "I"
-
-    @classmethod
-    def points_from_top_left(self, top_left: MinoPoint):
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x + 1, top_left.y),
-            MinoPoint(top_left.x + 2, top_left.y),
-            MinoPoint(top_left.x + 3, top_left.y),
-        ]
-        return points, Point(points[1].x + 0.5, top_left.y + 0.5)
+    _SHAPE_OFFSETS = ((0, 0), (1, 0), (2, 0), (3, 0))
+    _CENTRE_OFFSET = (1.5, 0.5)
 
 
 class JPiece(Piece):
     piece_index: int = 2
     letter: str = "J"
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        next_row_idx = top_left.y + 1
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x, next_row_idx),
-            MinoPoint(top_left.x + 1, next_row_idx),
-            MinoPoint(top_left.x + 2, next_row_idx),
-        ]
-        centre = points[2]
-        return points, Point(centre.x, centre.y)
+    _SHAPE_OFFSETS = ((0, 0), (0, 1), (1, 1), (2, 1))
+    _CENTRE_OFFSET = (1, 1)
 
 
 class LPiece(Piece):
     piece_index: int = 3
     letter: str = "L"
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        next_row_idx = top_left.y + 1
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x - 2, next_row_idx),
-            MinoPoint(top_left.x - 1, next_row_idx),
-            MinoPoint(top_left.x, next_row_idx),
-        ]
-        centre = points[2]
-        return points, Point(centre.x, centre.y)
+    _SHAPE_OFFSETS = ((0, 0), (-2, 1), (-1, 1), (0, 1))
+    _CENTRE_OFFSET = (-1, 1)
 
 
 class OPiece(Piece):
     piece_index: int = 4
     letter: str = "O"
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x + 1, top_left.y),
-            MinoPoint(top_left.x, top_left.y + 1),
-            MinoPoint(top_left.x + 1, top_left.y + 1),
-        ]
-        return points, Point(top_left.x + 0.5, top_left.y + 0.5)
-
+    _SHAPE_OFFSETS = ((0, 0), (1, 0), (0, 1), (1, 1))
+    _CENTRE_OFFSET = (0.5, 0.5)
 
 
 class SPiece(Piece):
     piece_index: int = 5
     letter: str = "S"
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x + 1, top_left.y),
-            MinoPoint(top_left.x - 1, top_left.y + 1),
-            MinoPoint(top_left.x, top_left.y + 1),
-        ]
-        centre = points[3]
-        return points, Point(centre.x, centre.y)
+    _SHAPE_OFFSETS = ((0, 0), (1, 0), (-1, 1), (0, 1))
+    _CENTRE_OFFSET = (0, 1)
 
 
 class TPiece(Piece):
     piece_index: int = 6
     letter: str = "T"
-
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        next_row_idx = top_left.y + 1
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x - 1, next_row_idx),
-            MinoPoint(top_left.x, next_row_idx),
-            MinoPoint(top_left.x + 1, next_row_idx),
-        ]
-        centre = points[2]
-        return points, Point(centre.x, centre.y)
+    _SHAPE_OFFSETS = ((0, 0), (-1, 1), (0, 1), (1, 1))
+    _CENTRE_OFFSET = (0, 1)
 
 
 class ZPiece(Piece):
     piece_index: int = 7
     letter: str = "Z"
-
-    @classmethod
-    def points_from_top_left(cls, top_left: MinoPoint):
-        points = [
-            MinoPoint(top_left.x, top_left.y),
-            MinoPoint(top_left.x + 1, top_left.y),
-            MinoPoint(top_left.x + 1, top_left.y + 1),
-            MinoPoint(top_left.x + 2, top_left.y + 1),
-        ]
-        centre = points[2]
-        return points, Point(centre.x, centre.y)
+    _SHAPE_OFFSETS = ((0, 0), (1, 0), (1, 1), (2, 1))
+    _CENTRE_OFFSET = (1, 1)
 
 
 SHAPE_POSSIBILITIES = [IPiece, ZPiece, LPiece, JPiece, SPiece, TPiece, OPiece]
 
+# Dedicated generator so piece spawning doesn't share the module-level
+# random state with anything else
+_rng = random.Random()
+
 
 def new_piece_type() -> Type[Piece]:
-    return random.choice(SHAPE_POSSIBILITIES)
+    return _rng.choice(SHAPE_POSSIBILITIES)
+
+
+# How far each shape extends left/right of its top-left block, derived once
+# from the shape offsets so spawn bounds are exact per piece type
+_SPAWN_X_MARGINS = {
+    cls: (
+        -min(dx for dx, _ in cls._SHAPE_OFFSETS),
+        max(dx for dx, _ in cls._SHAPE_OFFSETS),
+    )
+    for cls in SHAPE_POSSIBILITIES
+}
 
 
 class PieceGenerator:
@@ -320,11 +301,10 @@ class PieceGenerator:
         """
         piece_cls = self._generate_new_piece_type()
 
-        # TODO: use smarter logic for starting location of piece ?
-        # the +2 on the x and -3 on the y coordinates are used here to make sure all pieces can fit
-        # e.g 'I' piece has another 3 mino blocks on the right of the top left mino,
-        # and L has 2 on the left
-        top_left = MinoPoint(random.randint(0 + 2, self._board.width - 1 - 3), 0)
+        # Spawn anywhere the whole shape fits, using the piece's own margins
+        # rather than a one-size-fits-all +2/-3 fudge
+        left_margin, right_margin = _SPAWN_X_MARGINS[piece_cls]
+        top_left = MinoPoint(_rng.randint(left_margin, self._board.width - 1 - right_margin), 0)
         piece = piece_cls(self._board, top_left)
         return piece
 
@@ -16,6 +16,10 @@ DIRECTION_SHIFT = {
 
 @dataclass(frozen=True)
 class Point:
+    # Points are allocated constantly during moves/rotations, so skip the
+    # per-instance __dict__ (slots=True needs 3.10, we support 3.9)
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
@@ -32,6 +36,8 @@ class Point:
 
 @dataclass(frozen=True)
 class MinoPoint(Point):
+    __slots__ = ()
+
     x: int
     y: int
 
@@ -11,10 +11,21 @@ class Statistics:
 
     def inc_count(self, piece: Piece) -> None:
         self._shape_counts[piece.letter] += 1
+        self._version += 1
 
     @property
     def shape_counts(self) -> Dict[str, int]:
         return self._shape_counts
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter incremented whenever the counts change, so
+        renderers can reuse cached output while nothing has changed
+        :return: the current version number
+        """
+        return self._version
+
     def reset(self) -> None:
         self._shape_counts: Dict[str, int] = defaultdict(int)
+        self._version = getattr(self, "_version", 0) + 1
@@ -15,7 +15,7 @@ def board():
 def test_reached_top_row(board: Board):
     # Set non-empty space in top row
     assert not board.reached_top_row()
-    board._grid[ROW_PADDING][0] = 1
+    board._set_at_point(MinoPoint(0, ROW_PADDING), 1)
     assert board.reached_top_row()
 
 
@@ -24,6 +24,7 @@ def test_reset(board: Board):
     board.reset()
     assert board._grid is not initial_grid
     assert sum(sum(row)for row in board._grid) == 0
+    assert sum(board._row_masks) == 0
     assert len(board._grid) == board.height + ROW_PADDING
     assert len(board._grid[0]) == board.width
 
@@ -44,14 +45,14 @@ def test_add_piece(board: Board, pieces: List[Piece]):
 def test_clear_completed_rows(board: Board):
     for row in range(board._height - 2, board._height):
         for col in range(board.width):
-            board._grid[row][col] = 1
+            board._set_at_point(MinoPoint(col, row), 1)
 
     assert board._full_row(board._height - 1)
     assert board._full_row(board._height - 2)
     for row in range(board._height - 2):
         assert not board._full_row(row)
 
-    num_removed = board.clear_completed_rows(list(range(board._height)))
+    num_removed = board.clear_completed_rows()
     assert num_removed == 2
     for row in range(board._height):
         assert not board._full_row(row)
@@ -62,5 +63,5 @@ def test_space_below(board: Board):
     penultimate_row_point = MinoPoint(0, board._height - 2)
     assert not board.space_below(bottom_row_point)
     assert board.space_below(penultimate_row_point)
-    board._grid[board._height - 1][0] = 1
+    board._set_at_point(MinoPoint(0, board._height - 1), 1)
     assert not board.space_below(penultimate_row_point)